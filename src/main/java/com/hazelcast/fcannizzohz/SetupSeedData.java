@@ -1,13 +1,27 @@
 package com.hazelcast.fcannizzohz;
 
+import com.hazelcast.core.HazelcastInstance;
 import com.hazelcast.sql.SqlService;
 
+import java.util.List;
+
 import static com.hazelcast.fcannizzohz.Context.DEV_LOCALHOST;
 import static com.hazelcast.fcannizzohz.Utils.executeOnClientAndShutdown;
 import static com.hazelcast.fcannizzohz.Utils.runSQLFromFile;
 
 public class SetupSeedData {
 
+    // All seed data and mappings, in dependency order
+    static final List<String> SEED_FILES = List.of(
+            SetupCitiesMapping.SQL_FILE,
+            SetupCitiesData.SQL_FILE,
+            SetupTemperaturesMapping.SQL_FILE,
+            SetupTemperatureUpdatesMapping.SQL_FILE,
+            SetupTemperatureUpdatesOrderedView.SQL_FILE,
+            SetupTemperaturesEnrichedView.SQL_FILE,
+            SetupStreamedTemperaturesMapping.SQL_FILE,
+            SetupStreamedTemperaturesJob.SQL_FILE);
+
     private static void runSQL(String fileName, Context context) {
         executeOnClientAndShutdown(client -> {
             SqlService sqlService = client.getSql();
@@ -15,10 +29,27 @@ public class SetupSeedData {
         }, context);
     }
 
+    // Runs every seed file on a single client rather than connecting once per file
+    static void run(Context context) {
+        executeOnClientAndShutdown(SetupSeedData::seed, context);
+    }
+
+    static void seed(HazelcastInstance client) {
+        SqlService sqlService = client.getSql();
+        for (String fileName : SEED_FILES) {
+            runSQLFromFile(sqlService, fileName);
+        }
+    }
+
+    public static void main(String[] args) {
+        run(DEV_LOCALHOST);
+    }
+
     static class SetupCitiesMapping {
+        static final String SQL_FILE = "src/main/resources/cities_mapping.sql";
 
         static void run(Context context) {
-            runSQL("src/main/resources/cities_mapping.sql", context);
+            runSQL(SQL_FILE, context);
         }
 
         public static void main(String[] args) {
@@ -27,8 +58,10 @@ public class SetupSeedData {
     }
 
     static class SetupCitiesData {
+        static final String SQL_FILE = "src/main/resources/cities_data.sql";
+
         static void run(Context context) {
-            runSQL("src/main/resources/cities_data.sql", context);
+            runSQL(SQL_FILE, context);
         }
 
         public static void main(String[] args) {
@@ -37,8 +70,10 @@ public class SetupSeedData {
     }
 
     static class SetupTemperaturesMapping {
+        static final String SQL_FILE = "src/main/resources/temperatures_mapping.sql";
+
         static void run(Context context) {
-            runSQL("src/main/resources/temperatures_mapping.sql", context);
+            runSQL(SQL_FILE, context);
         }
 
         public static void main(String[] args) {
@@ -47,8 +82,10 @@ public class SetupSeedData {
     }
 
     static class SetupStreamedTemperaturesMapping {
+        static final String SQL_FILE = "src/main/resources/current_temperatures_map.sql";
+
         static void run(Context context) {
-            runSQL("src/main/resources/current_temperatures_map.sql", context);
+            runSQL(SQL_FILE, context);
         }
 
         public static void main(String[] args) {
@@ -57,8 +94,10 @@ public class SetupSeedData {
     }
 
     static class SetupStreamedTemperaturesJob {
+        static final String SQL_FILE = "src/main/resources/current_temperatures_job.sql";
+
         static void run(Context context) {
-            runSQL("src/main/resources/current_temperatures_job.sql", context);
+            runSQL(SQL_FILE, context);
         }
 
         public static void main(String[] args) {
@@ -67,8 +106,10 @@ public class SetupSeedData {
     }
 
     static class SetupTemperatureUpdatesMapping {
+        static final String SQL_FILE = "src/main/resources/temperature_updates_mapping.sql";
+
         static void run(Context context) {
-            runSQL("src/main/resources/temperature_updates_mapping.sql",  context);
+            runSQL(SQL_FILE, context);
         }
 
         public static void main(String[] args) {
@@ -77,8 +118,10 @@ public class SetupSeedData {
     }
 
     static class SetupTemperatureUpdatesOrderedView {
+        static final String SQL_FILE = "src/main/resources/temperature_updates_ordered_view.sql";
+
         static void run(Context context) {
-            runSQL("src/main/resources/temperature_updates_ordered_view.sql", context);
+            runSQL(SQL_FILE, context);
         }
 
         public static void main(String[] args) {
@@ -87,8 +130,10 @@ public class SetupSeedData {
     }
 
     static class SetupTemperaturesEnrichedView {
+        static final String SQL_FILE = "src/main/resources/temperatures_enriched_view.sql";
+
         static void run(Context context) {
-            runSQL("src/main/resources/temperatures_enriched_view.sql", context);
+            runSQL(SQL_FILE, context);
         }
 
         public static void main(String[] args) {
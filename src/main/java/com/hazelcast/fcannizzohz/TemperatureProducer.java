@@ -12,6 +12,7 @@ import java.util.Properties;
 import java.util.concurrent.*;
 import java.util.stream.Collectors;
 
+import com.hazelcast.core.HazelcastInstance;
 import com.hazelcast.sql.SqlResult;
 import com.hazelcast.sql.SqlService;
 import org.apache.kafka.common.serialization.StringSerializer;
@@ -20,7 +21,7 @@ import static com.hazelcast.fcannizzohz.Utils.executeOnClientAndShutdown;
 
 public class TemperatureProducer implements AutoCloseable {
     private static final DateTimeFormatter TS_FMT =
-            DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm:ss");
+            DateTimeFormatter.ofPattern("yyyy-MM-dd HH:mm:ss").withZone(ZoneId.systemDefault());
 
     private final KafkaProducer<String, String> producer;
     private final ScheduledExecutorService executor;
@@ -29,6 +30,10 @@ public class TemperatureProducer implements AutoCloseable {
     public static void run(String bootstrap, Context context) {
         System.out.println("Finding available city IDs");
         List<Integer> cityIds = TemperatureProducer.findCityIDs(context);
+        run(bootstrap, cityIds);
+    }
+
+    public static void run(String bootstrap, List<Integer> cityIds) {
         System.out.println("Found city IDs: " +  cityIds);
 
         Properties props = new Properties();
@@ -63,10 +68,10 @@ public class TemperatureProducer implements AutoCloseable {
             try {
                 int cityId = cityIDs.get(ThreadLocalRandom.current().nextInt(cityIDs.size()));
                 int temp = 10 + ThreadLocalRandom.current().nextInt(23);
-                String now = Instant.now().atZone(ZoneId.systemDefault()).format(TS_FMT);
+                String now = TS_FMT.format(Instant.now());
 
-                String json = String.format("{\"city_id\":%d,\"temperature\":%d,\"ts\":\"%s\"}",
-                        cityId, temp, now);
+                // plain concatenation: the payload is two ints and a fixed-pattern timestamp, nothing to escape
+                String json = "{\"city_id\":" + cityId + ",\"temperature\":" + temp + ",\"ts\":\"" + now + "\"}";
                 System.out.println("Sending '" + json + "' to topic " + topic);
                 producer.send(new ProducerRecord<>(topic, Integer.toString(cityId), json),
                         (meta, ex) -> {
@@ -87,16 +92,21 @@ public class TemperatureProducer implements AutoCloseable {
 
     public static List<Integer> findCityIDs(Context context) {
         return executeOnClientAndShutdown(client -> {
-            SqlService sql = client.getSql();
-            try (SqlResult r = sql.execute("select city_id from cities")) {
-                return r.stream()
-                        .map(row -> row.getObject("city_id"))
-                        .map(o -> Integer.parseInt(o.toString()))
-                        .collect(Collectors.toList());
-            }
+            return findCityIDs(client);
         }, context);
     }
 
+    public static List<Integer> findCityIDs(HazelcastInstance client) {
+        SqlService sql = client.getSql();
+        try (SqlResult r = sql.execute("select city_id from cities")) {
+            // resolve the column once; the mapping declares city_id as INT
+            int cityIdColumn = r.getRowMetadata().findColumn("city_id");
+            return r.stream()
+                    .map(row -> row.<Integer>getObject(cityIdColumn))
+                    .collect(Collectors.toList());
+        }
+    }
+
     @Override
     public void close() {
         executor.shutdown();
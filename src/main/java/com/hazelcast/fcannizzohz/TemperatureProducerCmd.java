@@ -6,6 +6,8 @@ import java.util.List;
 import java.util.Properties;
 import org.apache.kafka.common.serialization.StringSerializer;
 
+import static com.hazelcast.fcannizzohz.Utils.executeOnClientAndShutdown;
+
 @Command(name = "temperature-producer",
         mixinStandardHelpOptions = true,
         description = "Produces random temperature events to Kafka.")
@@ -32,18 +34,16 @@ public class TemperatureProducerCmd implements Runnable {
         System.out.println("Connecting to bootstrap server: " + bootstrap);
         System.out.println("Connecting to cluster: " + cluster + " with member: " + member);
         Context c = new Context(cluster, member);
-        if (seed) {
-            System.out.println("Setting seed data and mappings");
-            SetupSeedData.SetupCitiesMapping.run(c);
-            SetupSeedData.SetupCitiesData.run(c);
-            SetupSeedData.SetupTemperaturesMapping.run(c);
-            SetupSeedData.SetupTemperatureUpdatesMapping.run(c);
-            SetupSeedData.SetupTemperatureUpdatesOrderedView.run(c);
-            SetupSeedData.SetupTemperaturesEnrichedView.run(c);
-            SetupSeedData.SetupStreamedTemperaturesMapping.run(c);
-            SetupSeedData.SetupStreamedTemperaturesJob.run(c);
-        }
-        TemperatureProducer.run(bootstrap, new Context(cluster, member));
+        // seeding and the city ID lookup share one client connection
+        List<Integer> cityIds = executeOnClientAndShutdown(client -> {
+            if (seed) {
+                System.out.println("Setting seed data and mappings");
+                SetupSeedData.seed(client);
+            }
+            System.out.println("Finding available city IDs");
+            return TemperatureProducer.findCityIDs(client);
+        }, c);
+        TemperatureProducer.run(bootstrap, cityIds);
     }
 
     public static void main(String[] args) {